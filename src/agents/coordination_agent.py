@@ -7,7 +7,8 @@ ADKイベントバスを使用して他のエージェントとの協調を実
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -24,6 +25,22 @@ from .base_agent import (
 
 logger = logging.getLogger(__name__)
 
+# エージェント依存関係マップ（不変のためモジュールで一度だけ構築）
+_AGENT_DEPENDENCIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "participant_agent": (),  # 依存なし
+    "scheduling_agent": ("participant_agent",),
+    "venue_agent": ("scheduling_agent",),
+    "calendar_agent": ("scheduling_agent", "venue_agent")
+})
+
+# フェーズごとに開始するエージェントとタスク
+_PHASE_AGENTS: Mapping[CoordinationPhase, Tuple[str, str]] = MappingProxyType({
+    CoordinationPhase.PARTICIPANT_COLLECTION: ("participant_agent", "参加者収集"),
+    CoordinationPhase.SCHEDULE_COORDINATION: ("scheduling_agent", "スケジュール調整"),
+    CoordinationPhase.VENUE_COORDINATION: ("venue_agent", "会場検索・予約"),
+    CoordinationPhase.CALENDAR_INTEGRATION: ("calendar_agent", "カレンダー統合")
+})
+
 
 class WorkflowDecision(BaseModel):
     """ワークフロー決定"""
@@ -113,13 +130,8 @@ class CoordinationAgent(BaseAgent):
         self.managed_agents: Dict[str, AgentInstance] = {}
         self.workflow_decisions: List[WorkflowDecision] = []
 
-        # エージェント依存関係マップ
-        self.agent_dependencies = {
-            "participant_agent": [],  # 依存なし
-            "scheduling_agent": ["participant_agent"],
-            "venue_agent": ["scheduling_agent"],
-            "calendar_agent": ["scheduling_agent", "venue_agent"]
-        }
+        # エージェント依存関係マップ（全インスタンスで共有）
+        self.agent_dependencies = _AGENT_DEPENDENCIES
 
         # フェーズ遷移ルール
         self.phase_transitions = {
@@ -345,7 +357,7 @@ class CoordinationAgent(BaseAgent):
         agent = self.managed_agents[agent_name]
 
         # 依存関係チェック
-        dependencies = self.agent_dependencies.get(agent_name, [])
+        dependencies = self.agent_dependencies.get(agent_name, ())
         for dep in dependencies:
             if dep not in self.managed_agents:
                 logger.warning(f"依存関係未満足: {agent_name} requires {dep}")
@@ -432,17 +444,10 @@ class CoordinationAgent(BaseAgent):
 
     async def _start_phase_agents(self, phase: CoordinationPhase) -> None:
         """フェーズに応じたエージェントを開始"""
-        if phase == CoordinationPhase.PARTICIPANT_COLLECTION:
-            await self._start_agent("participant_agent", "参加者収集")
-
-        elif phase == CoordinationPhase.SCHEDULE_COORDINATION:
-            await self._start_agent("scheduling_agent", "スケジュール調整")
-
-        elif phase == CoordinationPhase.VENUE_COORDINATION:
-            await self._start_agent("venue_agent", "会場検索・予約")
-
-        elif phase == CoordinationPhase.CALENDAR_INTEGRATION:
-            await self._start_agent("calendar_agent", "カレンダー統合")
+        phase_agent = _PHASE_AGENTS.get(phase)
+        if phase_agent:
+            agent_name, task = phase_agent
+            await self._start_agent(agent_name, task)
 
     # 決定管理
 
@@ -473,6 +478,10 @@ class CoordinationAgent(BaseAgent):
 
     # ユーティリティメソッド
 
+    def _get_agent_dependencies(self) -> Mapping[str, Tuple[str, ...]]:
+        """エージェント依存関係マップを取得（共有の読み取り専用ビュー）"""
+        return self.agent_dependencies
+
     async def _get_assigned_tasks(self, agent_name: str) -> List[str]:
         """エージェントに割り当てられたタスクを取得"""
         task_assignments = {
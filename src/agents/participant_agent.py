@@ -6,6 +6,7 @@
 """
 
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Pattern
 from uuid import uuid4
@@ -530,14 +531,13 @@ class ParticipantAgent(BaseAgent):
 
     async def _send_completion_report(self) -> None:
         """完了報告を送信"""
+        # 1回の走査でステータス別に集計
+        status_counts = Counter(p.participation_status for p in self.participants.values())
         completion_report = {
             "total_participants": len(self.participants),
-            "confirmed_participants": len([p for p in self.participants.values()
-                                         if p.participation_status == ParticipationStatus.CONFIRMED]),
-            "declined_participants": len([p for p in self.participants.values()
-                                        if p.participation_status == ParticipationStatus.DECLINED]),
-            "pending_participants": len([p for p in self.participants.values()
-                                       if p.participation_status == ParticipationStatus.PENDING])
+            "confirmed_participants": status_counts[ParticipationStatus.CONFIRMED],
+            "declined_participants": status_counts[ParticipationStatus.DECLINED],
+            "pending_participants": status_counts[ParticipationStatus.PENDING]
         }
 
         completion_message = AgentMessage(
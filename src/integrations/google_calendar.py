@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 import logging
 from urllib.parse import urlencode
 import base64
+import random
 import secrets
 
 logger = logging.getLogger(__name__)
@@ -502,7 +503,9 @@ class CalendarEventManager:
                 logger.warning(f"イベント作成試行 {attempt + 1} 失敗: {last_error}")
 
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # 指数バックオフ
+                    # 指数バックオフ（ジッターで並行リトライのタイミングを分散）
+                    backoff = 2 ** attempt
+                    await asyncio.sleep(backoff + random.uniform(0, backoff / 2))
 
         return CalendarEventResponse(
             success=False,
@@ -0,0 +1,124 @@
+"""
+Shared fixtures for contract tests.
+"""
+
+import functools
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from tests.contract.slack_common import TEST_SIGNING_SECRET
+from tests.contract.slack_common import sign
+
+# The app under test must verify against the same secret the tests sign with;
+# set before any test imports src.main
+os.environ["SLACK_SIGNING_SECRET"] = TEST_SIGNING_SECRET
+
+
+@functools.cache
+def _app_available() -> bool:
+    """Whether the FastAPI application module exists (probed once per session)."""
+    return importlib.util.find_spec("src.main") is not None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "requires_app: skip unless the FastAPI app (src.main) exists"
+    )
+    config.addinivalue_line(
+        "markers", "slow: memory/perf-only tests, excluded from per-commit CI"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Skip app-backed tests up front while the implementation is missing (TDD)."""
+    if _app_available():
+        return
+
+    skip = pytest.mark.skip(reason="実装がまだ利用できません")
+    for item in items:
+        if item.get_closest_marker("requires_app"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def app() -> Any:
+    """The FastAPI application, imported only when a test needs it."""
+    from src.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app: Any) -> Iterator[Any]:
+    """Session-wide TestClient; app startup/shutdown run once for all tests.
+
+    Handler errors come back as 500 responses so status-code assertions
+    report them instead of aborting the request.
+    """
+    from fastapi.testclient import TestClient
+
+    with TestClient(
+        app, backend="asyncio", raise_server_exceptions=False
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def pool() -> Iterator[ThreadPoolExecutor]:
+    """Thread pool for sending concurrent requests through the session ``client``.
+
+    Every request still runs on the client's own event loop, the one its
+    lifespan started on.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(request: pytest.FixtureRequest) -> None:
+    """Hit each endpoint under test once before the first real test runs.
+
+    Requests go through the session ``client`` the tests use, after its
+    lifespan has started, so route resolution and first-request setup stay
+    out of the response-time assertions.
+    """
+    if not _app_available():
+        return
+
+    client = request.getfixturevalue("client")
+    for method, path in [
+        ("POST", "/api/events"),
+        ("GET", "/api/events/warmup"),
+        ("POST", "/slack/events"),
+    ]:
+        client.request(method, path, content=b"{}")
+
+
+@pytest.fixture(scope="session")
+def slack_signer() -> Callable[[bytes, str], str]:
+    """Return a function computing a valid Slack v0 request signature.
+
+    Signatures use the suite's fixed test secret, which the app under test
+    also reads from ``SLACK_SIGNING_SECRET`` (set at the top of this module).
+    """
+    return sign
+
+
+@pytest.fixture(scope="session")
+def url_verification_payload() -> Dict[str, Any]:
+    """Valid URL verification challenge payload."""
+    return {
+        "type": "url_verification",
+        "challenge": "test_challenge_string_12345"
+    }
@@ -0,0 +1,67 @@
+"""
+Slack request data shared by the Slack contract tests.
+"""
+
+import hashlib
+import hmac
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import orjson
+import pytest
+
+# Computes a Slack v0 signature for (body, timestamp); see the slack_signer fixture
+Signer = Callable[[bytes, str], str]
+
+# Signing secret for the whole contract suite; conftest hands the same value
+# to the app under test through SLACK_SIGNING_SECRET
+TEST_SIGNING_SECRET = "contract-test-signing-secret"
+
+
+def sign(body: bytes, timestamp: str) -> str:
+    """Slack v0 signature of ``body`` at ``timestamp`` under the test secret."""
+    base = b"v0:" + timestamp.encode() + b":" + body
+    return "v0=" + hmac.new(
+        TEST_SIGNING_SECRET.encode(), base, hashlib.sha256
+    ).hexdigest()
+
+
+# Plain JSON request headers (no Slack signature)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_params(params: List[Any]) -> List[Any]:
+    """Re-emit parametrize cases with their payload pre-serialized to bytes."""
+    return [pytest.param(orjson.dumps(p.values[0]), id=p.id) for p in params]
+
+
+def signed_headers(body: bytes, signer: Signer) -> Dict[str, str]:
+    """Headers carrying a valid signature for ``body`` at the current time."""
+    timestamp = str(int(time.time()))
+    return {
+        **JSON_HEADERS,
+        "X-Slack-Signature": signer(body, timestamp),
+        "X-Slack-Request-Timestamp": timestamp
+    }
+
+
+def slack_headers(body: bytes) -> Dict[str, str]:
+    """Headers validly signed for ``body`` with the test secret, timestamped now."""
+    return signed_headers(body, sign)
+
+
+def invalid_signature_headers(body: bytes, signer: Signer) -> Dict[str, str]:
+    """Current-time Slack headers whose signature does not match the body."""
+    return {
+        **JSON_HEADERS,
+        "X-Slack-Signature": "v0=invalid_signature",
+        "X-Slack-Request-Timestamp": str(int(time.time()))
+    }
+
+
+def missing_signature_headers(body: bytes, signer: Signer) -> Dict[str, str]:
+    """Headers without any Slack signature."""
+    return JSON_HEADERS
@@ -7,98 +7,188 @@ OpenAPI仕様に従って正しく動作することを検証します。
 参照: specs/002-slack-bot-ai/contracts/internal_event_api.yaml
 """
 
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Set
 from datetime import datetime, timedelta
 
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-# NOTE: これらのインポートは実装が存在するまで失敗します（TDD）
-# これはTDDアプローチに期待される必要な動作です
-try:
-    from src.main import app
-    from src.models.event import Event, EventStatus, EventType
-    from src.api.events import EventsRouter
-except ImportError:
-    # TDD段階では期待される - テストは最初に失敗する必要があります
-    pytest.skip("実装がまだ利用できません", allow_module_level=True)
+# NOTE: 実装（src.main）が存在するまで全テストをスキップします（TDD）
+# 判定はconftestで一度だけ行い、appはフィクスチャで遅延インポートします
+pytestmark = pytest.mark.requires_app
+
+
+_EVENT_TEMPLATE: Dict[str, Any] = {
+    "title": "チームランチミーティング",
+    "description": "月次チームランチで情報共有と親睦を深める",
+    "event_type": "dining",
+    "organizer_id": "U0123456789",
+    "channel_id": "C1234567890",
+    "participants": [
+        {
+            "user_id": "U1111111111",
+            "display_name": "田中太郎",
+            "email": "tanaka@example.com"
+        },
+        {
+            "user_id": "U2222222222",
+            "display_name": "佐藤花子",
+            "email": "sato@example.com"
+        }
+    ],
+    "proposed_dates": [
+        {
+            "start_time": "2024-03-20T12:00:00+09:00",
+            "end_time": "2024-03-20T13:30:00+09:00"
+        },
+        {
+            "start_time": "2024-03-22T12:00:00+09:00",
+            "end_time": "2024-03-22T13:30:00+09:00"
+        }
+    ],
+    "venue_preferences": {
+        "type": "restaurant",
+        "location": "渋谷",
+        "budget_per_person": 2000,
+        "capacity": 5
+    }
+}
+
+_JAPANESE_EVENT_TEMPLATE: Dict[str, Any] = {
+    "title": "勉強会：AI・機械学習入門",
+    "description": "初心者向けのAI・機械学習勉強会です。\n\n内容：\n- 機械学習の基礎\n- Pythonでの実装\n- 実践的な演習",
+    "event_type": "meeting",
+    "organizer_id": "U0123456789",
+    "channel_id": "C1234567890",
+    "participants": [
+        {
+            "user_id": "U3333333333",
+            "display_name": "山田一郎",
+            "email": "yamada@example.com"
+        }
+    ],
+    "proposed_dates": [
+        {
+            "start_time": "2024-03-25T14:00:00+09:00",
+            "end_time": "2024-03-25T17:00:00+09:00"
+        }
+    ],
+    "venue_preferences": {
+        "type": "meeting_room",
+        "location": "会議室A",
+        "capacity": 15
+    }
+}
+
+# 変更しないテンプレートはインポート時に一度だけシリアライズする
+_EVENT_BYTES = orjson.dumps(_EVENT_TEMPLATE)
+_JAPANESE_EVENT_BYTES = orjson.dumps(_JAPANESE_EVENT_TEMPLATE)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# タイトルだけを変えるリクエストは、プレースホルダー入りの本文を差し替えて作る
+_TITLE_PLACEHOLDER = b'"__TITLE__"'
+_EVENT_BYTES_TITLE_TEMPLATE = orjson.dumps({**_EVENT_TEMPLATE, "title": "__TITLE__"})
+assert _EVENT_BYTES_TITLE_TEMPLATE.count(_TITLE_PLACEHOLDER) == 1
+
+
+def _event_bytes_with_title(title: str) -> bytes:
+    """タイトルのみ差し替えたイベントデータのJSONを返す。"""
+    return _EVENT_BYTES_TITLE_TEMPLATE.replace(_TITLE_PLACEHOLDER, orjson.dumps(title))
+
+
+_INVALID_EVENT_CASES = [
+    pytest.param(
+        {
+            "description": "タイトルなし",
+            "event_type": "dining"
+        },
+        id="missing_title"
+    ),
+    pytest.param(
+        {
+            "title": "テストイベント",
+            "event_type": "invalid_type"
+        },
+        id="invalid_event_type"
+    ),
+    pytest.param(
+        {
+            "title": "テストイベント",
+            "event_type": "dining",
+            "proposed_dates": [
+                {
+                    "start_time": "invalid-date",
+                    "end_time": "2024-03-20T13:30:00+09:00"
+                }
+            ]
+        },
+        id="invalid_date_format"
+    ),
+    pytest.param(
+        {
+            "title": "テストイベント",
+            "event_type": "dining",
+            "proposed_dates": [
+                {
+                    "start_time": "2024-03-20T14:00:00+09:00",
+                    "end_time": "2024-03-20T12:00:00+09:00"
+                }
+            ]
+        },
+        id="end_before_start"
+    )
+]
+
+
+def _expect(response: httpx.Response, status: int) -> httpx.Response:
+    """ステータスコードを検証し、不一致時はレスポンス本文を含めて失敗させる。"""
+    if response.status_code != status:
+        raise AssertionError(f"{response.status_code}: {response.text[:200]}")
+    return response
+
+
+def _create_events(
+    client: TestClient, pool: ThreadPoolExecutor, bodies: Iterable[bytes]
+) -> List[str]:
+    """イベントをスレッドプールで並行作成し、全て201であることを検証してIDを返す。"""
+    def create(body: bytes) -> httpx.Response:
+        return client.post("/api/events", content=body, headers=_JSON_HEADERS)
+
+    return [_expect(r, 201).json()["id"] for r in pool.map(create, bodies)]
+
+
+def _listed_ids(client: TestClient, query: str = "") -> Set[str]:
+    """一覧APIを全ページ走査し、返されたイベントIDの集合を返す。"""
+    ids: Set[str] = set()
+    page = 1
+    while True:
+        body = _expect(client.get(f"/api/events?page={page}{query}"), 200).json()
+        ids.update(item["id"] for item in body["items"])
+        if not body["items"] or page * body["size"] >= body["total"]:
+            return ids
+        page += 1
+
+
+def _by_uid(participants: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """参加者リストをuser_idをキーとする辞書に変換。"""
+    return {p["user_id"]: p for p in participants}
 
 
 class TestInternalEventAPI:
     """内部Event APIコントラクトテスト。"""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """テスト用APIクライアント。"""
-        return TestClient(app)
-
     @pytest.fixture
     def event_data(self) -> Dict[str, Any]:
         """有効なイベントデータ。"""
-        return {
-            "title": "チームランチミーティング",
-            "description": "月次チームランチで情報共有と親睦を深める",
-            "event_type": "dining",
-            "organizer_id": "U0123456789",
-            "channel_id": "C1234567890",
-            "participants": [
-                {
-                    "user_id": "U1111111111",
-                    "display_name": "田中太郎",
-                    "email": "tanaka@example.com"
-                },
-                {
-                    "user_id": "U2222222222",
-                    "display_name": "佐藤花子",
-                    "email": "sato@example.com"
-                }
-            ],
-            "proposed_dates": [
-                {
-                    "start_time": "2024-03-20T12:00:00+09:00",
-                    "end_time": "2024-03-20T13:30:00+09:00"
-                },
-                {
-                    "start_time": "2024-03-22T12:00:00+09:00",
-                    "end_time": "2024-03-22T13:30:00+09:00"
-                }
-            ],
-            "venue_preferences": {
-                "type": "restaurant",
-                "location": "渋谷",
-                "budget_per_person": 2000,
-                "capacity": 5
-            }
-        }
+        return _EVENT_TEMPLATE
 
     @pytest.fixture
     def japanese_event_data(self) -> Dict[str, Any]:
         """日本語イベントデータ。"""
-        return {
-            "title": "勉強会：AI・機械学習入門",
-            "description": "初心者向けのAI・機械学習勉強会です。\n\n内容：\n- 機械学習の基礎\n- Pythonでの実装\n- 実践的な演習",
-            "event_type": "meeting",
-            "organizer_id": "U0123456789",
-            "channel_id": "C1234567890",
-            "participants": [
-                {
-                    "user_id": "U3333333333",
-                    "display_name": "山田一郎",
-                    "email": "yamada@example.com"
-                }
-            ],
-            "proposed_dates": [
-                {
-                    "start_time": "2024-03-25T14:00:00+09:00",
-                    "end_time": "2024-03-25T17:00:00+09:00"
-                }
-            ],
-            "venue_preferences": {
-                "type": "meeting_room",
-                "location": "会議室A",
-                "capacity": 15
-            }
-        }
+        return _JAPANESE_EVENT_TEMPLATE
 
     def test_create_event_success(
         self,
@@ -106,14 +196,10 @@ class TestInternalEventAPI:
         event_data: Dict[str, Any]
     ) -> None:
         """イベント作成成功テスト。"""
-        response = client.post(
-            "/api/events",
-            json=event_data,
-            headers={"Content-Type": "application/json"}
-        )
-
-        assert response.status_code == 201
-        created_event = response.json()
+        created_event = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
 
         # レスポンス構造検証
         assert "id" in created_event
@@ -133,14 +219,14 @@ class TestInternalEventAPI:
         japanese_event_data: Dict[str, Any]
     ) -> None:
         """日本語イベント作成テスト。"""
-        response = client.post(
-            "/api/events",
-            json=japanese_event_data,
-            headers={"Content-Type": "application/json; charset=utf-8"}
-        )
-
-        assert response.status_code == 201
-        created_event = response.json()
+        created_event = _expect(
+            client.post(
+                "/api/events",
+                content=_JAPANESE_EVENT_BYTES,
+                headers={"Content-Type": "application/json; charset=utf-8"}
+            ),
+            201
+        ).json()
 
         # 日本語文字が正しく保存されているか確認
         assert "勉強会" in created_event["title"]
@@ -153,24 +239,21 @@ class TestInternalEventAPI:
     ) -> None:
         """イベント取得成功テスト。"""
         # まずイベントを作成
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         # イベントを取得
-        response = client.get(f"/api/events/{event_id}")
-
-        assert response.status_code == 200
-        event = response.json()
+        event = _expect(client.get(f"/api/events/{event_id}"), 200).json()
 
         assert event["id"] == event_id
-        assert event["title"] == event_data["title"]
+        assert event["title"] == created["title"]
 
     def test_get_event_not_found(self, client: TestClient) -> None:
         """存在しないイベント取得テスト。"""
-        response = client.get("/api/events/nonexistent-id")
-
-        assert response.status_code == 404
-        error = response.json()
+        error = _expect(client.get("/api/events/nonexistent-id"), 404).json()
         assert "detail" in error
         assert "not found" in error["detail"].lower()
 
@@ -181,8 +264,11 @@ class TestInternalEventAPI:
     ) -> None:
         """イベント更新成功テスト。"""
         # イベント作成
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         # 更新データ
         update_data = {
@@ -192,13 +278,10 @@ class TestInternalEventAPI:
         }
 
         # イベント更新
-        response = client.patch(
-            f"/api/events/{event_id}",
-            json=update_data
-        )
-
-        assert response.status_code == 200
-        updated_event = response.json()
+        updated_event = _expect(
+            client.patch(f"/api/events/{event_id}", json=update_data),
+            200
+        ).json()
 
         assert updated_event["title"] == update_data["title"]
         assert updated_event["description"] == update_data["description"]
@@ -211,97 +294,93 @@ class TestInternalEventAPI:
     ) -> None:
         """イベント削除成功テスト。"""
         # イベント作成
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         # イベント削除
-        response = client.delete(f"/api/events/{event_id}")
-
-        assert response.status_code == 204
+        _expect(client.delete(f"/api/events/{event_id}"), 204)
 
         # 削除確認
-        get_response = client.get(f"/api/events/{event_id}")
-        assert get_response.status_code == 404
+        _expect(client.get(f"/api/events/{event_id}"), 404)
 
     def test_list_events_success(
         self,
         client: TestClient,
-        event_data: Dict[str, Any]
+        pool: ThreadPoolExecutor
     ) -> None:
         """イベント一覧取得成功テスト。"""
-        # 複数のイベントを作成
-        for i in range(3):
-            event_copy = event_data.copy()
-            event_copy["title"] = f"イベント{i+1}"
-            client.post("/api/events", json=event_copy)
+        # 複数のイベントを並行して作成
+        created_ids = _create_events(
+            client, pool, (_event_bytes_with_title(f"イベント{i+1}") for i in range(3))
+        )
 
         # イベント一覧取得
-        response = client.get("/api/events")
-
-        assert response.status_code == 200
-        events = response.json()
+        events = _expect(client.get("/api/events"), 200).json()
 
         assert "items" in events
         assert "total" in events
         assert "page" in events
         assert "size" in events
-        assert len(events["items"]) >= 3
+
+        # 作成したイベントがすべて一覧に含まれることを確認
+        assert set(created_ids) <= _listed_ids(client)
 
     def test_list_events_with_filters(
         self,
         client: TestClient,
+        pool: ThreadPoolExecutor,
         event_data: Dict[str, Any]
     ) -> None:
         """フィルター付きイベント一覧取得テスト。"""
         # 異なるタイプのイベントを作成
-        dining_event = event_data.copy()
-        dining_event["event_type"] = "dining"
-        dining_event["title"] = "ランチイベント"
-
-        meeting_event = event_data.copy()
-        meeting_event["event_type"] = "meeting"
-        meeting_event["title"] = "ミーティングイベント"
+        dining_event = {**event_data, "event_type": "dining", "title": "ランチイベント"}
+        meeting_event = {
+            **event_data,
+            "event_type": "meeting",
+            "title": "ミーティングイベント"
+        }
 
-        client.post("/api/events", json=dining_event)
-        client.post("/api/events", json=meeting_event)
+        dining_id, meeting_id = _create_events(
+            client, pool, map(orjson.dumps, (dining_event, meeting_event))
+        )
 
         # タイプでフィルター
-        response = client.get("/api/events?event_type=dining")
-
-        assert response.status_code == 200
-        events = response.json()
+        events = _expect(client.get("/api/events?event_type=dining"), 200).json()
 
         # diningタイプのイベントのみ取得されることを確認
         for event in events["items"]:
             assert event["event_type"] == "dining"
 
+        # 作成したdiningイベントのみがフィルター結果に含まれることを確認
+        filtered_ids = _listed_ids(client, "&event_type=dining")
+        assert dining_id in filtered_ids
+        assert meeting_id not in filtered_ids
+
     def test_list_events_pagination(
         self,
         client: TestClient,
-        event_data: Dict[str, Any]
+        pool: ThreadPoolExecutor
     ) -> None:
         """ページネーション付きイベント一覧取得テスト。"""
-        # 多数のイベントを作成
-        for i in range(10):
-            event_copy = event_data.copy()
-            event_copy["title"] = f"ページネーションテスト{i+1}"
-            client.post("/api/events", json=event_copy)
+        # 多数のイベントを並行して作成
+        _create_events(
+            client,
+            pool,
+            (_event_bytes_with_title(f"ページネーションテスト{i+1}") for i in range(10))
+        )
 
         # 1ページ目（サイズ5）
-        response = client.get("/api/events?page=1&size=5")
-
-        assert response.status_code == 200
-        page1 = response.json()
+        page1 = _expect(client.get("/api/events?page=1&size=5"), 200).json()
 
         assert len(page1["items"]) == 5
         assert page1["page"] == 1
         assert page1["size"] == 5
 
         # 2ページ目
-        response = client.get("/api/events?page=2&size=5")
-
-        assert response.status_code == 200
-        page2 = response.json()
+        page2 = _expect(client.get("/api/events?page=2&size=5"), 200).json()
 
         assert page2["page"] == 2
         # 1ページ目と2ページ目のアイテムが異なることを確認
@@ -316,8 +395,11 @@ class TestInternalEventAPI:
     ) -> None:
         """参加者追加成功テスト。"""
         # イベント作成
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         # 新しい参加者
         new_participant = {
@@ -327,19 +409,18 @@ class TestInternalEventAPI:
         }
 
         # 参加者追加
-        response = client.post(
-            f"/api/events/{event_id}/participants",
-            json=new_participant
+        _expect(
+            client.post(
+                f"/api/events/{event_id}/participants",
+                json=new_participant
+            ),
+            201
         )
 
-        assert response.status_code == 201
-
         # イベント確認
-        get_response = client.get(f"/api/events/{event_id}")
-        event = get_response.json()
+        event = _expect(client.get(f"/api/events/{event_id}"), 200).json()
 
-        participant_ids = [p["user_id"] for p in event["participants"]]
-        assert new_participant["user_id"] in participant_ids
+        assert new_participant["user_id"] in _by_uid(event["participants"])
 
     def test_remove_participant_success(
         self,
@@ -348,25 +429,25 @@ class TestInternalEventAPI:
     ) -> None:
         """参加者削除成功テスト。"""
         # イベント作成
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         # 参加者のuser_id
         participant_id = event_data["participants"][0]["user_id"]
 
         # 参加者削除
-        response = client.delete(
-            f"/api/events/{event_id}/participants/{participant_id}"
+        _expect(
+            client.delete(f"/api/events/{event_id}/participants/{participant_id}"),
+            204
         )
 
-        assert response.status_code == 204
-
         # イベント確認
-        get_response = client.get(f"/api/events/{event_id}")
-        event = get_response.json()
+        event = _expect(client.get(f"/api/events/{event_id}"), 200).json()
 
-        participant_ids = [p["user_id"] for p in event["participants"]]
-        assert participant_id not in participant_ids
+        assert participant_id not in _by_uid(event["participants"])
 
     def test_update_participant_response(
         self,
@@ -375,8 +456,11 @@ class TestInternalEventAPI:
     ) -> None:
         """参加者回答更新テスト。"""
         # イベント作成
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         participant_id = event_data["participants"][0]["user_id"]
 
@@ -386,64 +470,29 @@ class TestInternalEventAPI:
             "message": "参加します！楽しみです。"
         }
 
-        response = client.patch(
-            f"/api/events/{event_id}/participants/{participant_id}/response",
-            json=response_data
+        _expect(
+            client.patch(
+                f"/api/events/{event_id}/participants/{participant_id}/response",
+                json=response_data
+            ),
+            200
         )
 
-        assert response.status_code == 200
-
         # イベント確認
-        get_response = client.get(f"/api/events/{event_id}")
-        event = get_response.json()
+        event = _expect(client.get(f"/api/events/{event_id}"), 200).json()
 
-        participant = next(
-            p for p in event["participants"]
-            if p["user_id"] == participant_id
-        )
+        participant = _by_uid(event["participants"])[participant_id]
         assert participant["response_status"] == "confirmed"
         assert participant["response_message"] == response_data["message"]
 
-    def test_create_event_validation(self, client: TestClient) -> None:
+    @pytest.mark.parametrize("invalid_data", _INVALID_EVENT_CASES)
+    def test_create_event_validation(
+        self,
+        client: TestClient,
+        invalid_data: Dict[str, Any]
+    ) -> None:
         """イベント作成バリデーションテスト。"""
-        invalid_cases = [
-            # 必須フィールド不足
-            {
-                "description": "タイトルなし",
-                "event_type": "dining"
-            },
-            # 無効なイベントタイプ
-            {
-                "title": "テストイベント",
-                "event_type": "invalid_type"
-            },
-            # 無効な日付形式
-            {
-                "title": "テストイベント",
-                "event_type": "dining",
-                "proposed_dates": [
-                    {
-                        "start_time": "invalid-date",
-                        "end_time": "2024-03-20T13:30:00+09:00"
-                    }
-                ]
-            },
-            # 終了時刻が開始時刻より前
-            {
-                "title": "テストイベント",
-                "event_type": "dining",
-                "proposed_dates": [
-                    {
-                        "start_time": "2024-03-20T14:00:00+09:00",
-                        "end_time": "2024-03-20T12:00:00+09:00"
-                    }
-                ]
-            }
-        ]
-
-        for invalid_data in invalid_cases:
-            response = client.post("/api/events", json=invalid_data)
-            assert response.status_code == 422
+        _expect(client.post("/api/events", json=invalid_data), 422)
 
     def test_event_status_transitions(
         self,
@@ -452,8 +501,11 @@ class TestInternalEventAPI:
     ) -> None:
         """イベントステータス遷移テスト。"""
         # イベント作成（初期ステータス: proposed）
-        create_response = client.post("/api/events", json=event_data)
-        event_id = create_response.json()["id"]
+        created = _expect(
+            client.post("/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS),
+            201
+        ).json()
+        event_id = created["id"]
 
         # ステータス遷移テスト
         status_transitions = [
@@ -464,21 +516,30 @@ class TestInternalEventAPI:
         ]
 
         for from_status, to_status in status_transitions:
-            response = client.patch(
-                f"/api/events/{event_id}",
-                json={"status": to_status}
+            _expect(
+                client.patch(f"/api/events/{event_id}", json={"status": to_status}),
+                200
             )
-            assert response.status_code == 200
 
             # ステータス確認
-            get_response = client.get(f"/api/events/{event_id}")
-            event = get_response.json()
+            event = _expect(client.get(f"/api/events/{event_id}"), 200).json()
             assert event["status"] == to_status
 
+    @pytest.mark.parametrize(
+        "query, expected_term",
+        [
+            ("q=Python", "Python"),
+            ("q=勉強会", "勉強会"),
+            ("q=ランチ", "ランチ")
+        ]
+    )
     def test_event_search(
         self,
         client: TestClient,
-        event_data: Dict[str, Any]
+        pool: ThreadPoolExecutor,
+        event_data: Dict[str, Any],
+        query: str,
+        expected_term: str
     ) -> None:
         """イベント検索テスト。"""
         # 複数のイベントを作成
@@ -488,41 +549,35 @@ class TestInternalEventAPI:
             {"title": "チームランチ", "description": "月次ランチミーティング"}
         ]
 
-        for event_data_item in events_to_create:
-            event_copy = event_data.copy()
-            event_copy.update(event_data_item)
-            client.post("/api/events", json=event_copy)
+        payloads = [{**event_data, **item} for item in events_to_create]
+        created_ids = _create_events(client, pool, map(orjson.dumps, payloads))
 
         # 検索テスト
-        search_cases = [
-            ("q=Python", "Python"),
-            ("q=勉強会", "勉強会"),
-            ("q=ランチ", "ランチ")
-        ]
-
-        for query, expected_term in search_cases:
-            response = client.get(f"/api/events?{query}")
-            assert response.status_code == 200
+        events = _expect(client.get(f"/api/events?{query}"), 200).json()
+        # 検索結果に期待するキーワードが含まれることを確認
+        found = any(
+            expected_term in event["title"] or expected_term in event["description"]
+            for event in events["items"]
+        )
+        assert found
 
-            events = response.json()
-            # 検索結果に期待するキーワードが含まれることを確認
-            found = any(
-                expected_term in event["title"] or expected_term in event["description"]
-                for event in events["items"]
-            )
-            assert found
+        # キーワードを含む作成済みイベントがすべて検索結果に含まれることを確認
+        matching_ids = {
+            event_id
+            for event_id, p in zip(created_ids, payloads, strict=True)
+            if expected_term in p["title"] or expected_term in p["description"]
+        }
+        assert matching_ids <= _listed_ids(client, f"&{query}")
 
     def test_api_error_responses(self, client: TestClient) -> None:
         """APIエラーレスポンステスト。"""
         # 404エラー
-        response = client.get("/api/events/nonexistent")
-        assert response.status_code == 404
-        assert "detail" in response.json()
+        error = _expect(client.get("/api/events/nonexistent"), 404).json()
+        assert "detail" in error
 
         # 422エラー（バリデーションエラー）
-        response = client.post("/api/events", json={"invalid": "data"})
-        assert response.status_code == 422
-        assert "detail" in response.json()
+        error = _expect(client.post("/api/events", json={"invalid": "data"}), 422).json()
+        assert "detail" in error
 
     def test_api_response_headers(
         self,
@@ -530,7 +585,9 @@ class TestInternalEventAPI:
         event_data: Dict[str, Any]
     ) -> None:
         """APIレスポンスヘッダーテスト。"""
-        response = client.post("/api/events", json=event_data)
+        response = client.post(
+            "/api/events", content=_EVENT_BYTES, headers=_JSON_HEADERS
+        )
 
         # Content-Typeヘッダー確認
         assert response.headers["content-type"] == "application/json"
@@ -541,30 +598,16 @@ class TestInternalEventAPI:
     def test_concurrent_event_operations(
         self,
         client: TestClient,
-        event_data: Dict[str, Any]
+        pool: ThreadPoolExecutor
     ) -> None:
         """同時イベント操作テスト。"""
-        import threading
-        import time
-
-        results = []
-
-        def create_event(index):
-            event_copy = event_data.copy()
-            event_copy["title"] = f"並行イベント{index}"
-            response = client.post("/api/events", json=event_copy)
-            results.append(response.status_code)
-
-        # 複数スレッドで同時にイベント作成
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=create_event, args=(i,))
-            threads.append(thread)
-            thread.start()
-
-        # 全スレッド完了を待機
-        for thread in threads:
-            thread.join()
-
-        # 全ての作成が成功することを確認
-        assert all(status == 201 for status in results)
\ No newline at end of file
+        def create_event(index: int) -> int:
+            response = client.post(
+                "/api/events",
+                content=_event_bytes_with_title(f"並行イベント{index}"),
+                headers=_JSON_HEADERS
+            )
+            return response.status_code
+
+        # 複数スレッドで同時にイベント作成し、全ての作成が成功することを確認
+        assert all(status == 201 for status in pool.map(create_event, range(5)))
@@ -7,45 +7,143 @@ bot mention events according to the Slack Events API specification.
 Reference: specs/002-slack-bot-ai/contracts/slack_events.yaml
 """
 
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-# NOTE: These imports will fail until implementation exists (TDD)
-# This is expected and required for TDD approach
-try:
-    from src.integrations.slack_handler import SlackEventHandler
-    from src.main import app
-except ImportError:
-    # Expected during TDD phase - tests should fail first
-    pytest.skip("Implementation not yet available", allow_module_level=True)
-
-
-class TestSlackBotMentions:
-    """Test Slack bot mention events contract."""
-
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client for Slack event endpoint."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def bot_mention_payload(self) -> Dict[str, Any]:
-        """Valid bot mention event payload."""
-        return {
+from tests.contract.slack_common import (
+    JSON_HEADERS,
+    Signer,
+    invalid_signature_headers,
+    missing_signature_headers,
+    slack_headers
+)
+
+# NOTE: Tests are skipped until the implementation (src.main) exists (TDD)
+# The check runs once in conftest; the app is imported lazily by fixtures
+pytestmark = pytest.mark.requires_app
+
+
+# Valid bot mention event payload, serialized once at import
+_BOT_MENTION_PAYLOAD: Dict[str, Any] = {
+    "type": "event_callback",
+    "team_id": "T1234567890",
+    "api_app_id": "A1234567890",
+    "event": {
+        "type": "app_mention",
+        "text": "<@U0123456789> 来週チームでランチしませんか？ <@U1111111111> <@U2222222222>",
+        "user": "U0123456789",  # Organizer
+        "channel": "C1234567890",
+        "ts": "1234567890.123456",
+        "event_ts": "1234567890.123456"
+    }
+}
+_BOT_MENTION_BYTES = orjson.dumps(_BOT_MENTION_PAYLOAD)
+
+
+def _old_timestamp_headers(body: bytes, sign: Signer) -> Dict[str, str]:
+    # Correctly signed but 400 seconds old (replay attack protection, > 5 minutes)
+    old_timestamp = str(int(time.time()) - 400)
+    return {
+        **JSON_HEADERS,
+        "X-Slack-Signature": sign(body, old_timestamp),
+        "X-Slack-Request-Timestamp": old_timestamp
+    }
+
+
+_SIGNATURE_REJECTION_CASES = [
+    pytest.param(invalid_signature_headers, id="invalid_signature"),
+    pytest.param(missing_signature_headers, id="missing_signature"),
+    pytest.param(_old_timestamp_headers, id="old_timestamp")
+]
+
+_MISSING_FIELD_PAYLOADS = [
+    pytest.param(
+        {
             "type": "event_callback",
-            "team_id": "T1234567890",
-            "api_app_id": "A1234567890",
             "event": {
                 "type": "app_mention",
-                "text": "<@U0123456789> 来週チームでランチしませんか？ <@U1111111111> <@U2222222222>",
-                "user": "U0123456789",  # Organizer
+                "text": "<@U0123456789> test",
                 "channel": "C1234567890",
-                "ts": "1234567890.123456",
-                "event_ts": "1234567890.123456"
+                "ts": "1234567890.123456"
             }
-        }
+        },
+        id="missing_user"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "app_mention",
+                "text": "<@U0123456789> test",
+                "user": "U0123456789",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="missing_channel"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "app_mention",
+                "user": "U0123456789",
+                "channel": "C1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="missing_text"
+    )
+]
+
+_JAPANESE_MENTION_PAYLOADS = [
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "app_mention",
+                "text": "<@U0123456789> 今度チームでランチしませんか <@U1111111111>",
+                "user": "U0123456789",
+                "channel": "C1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="dining"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "app_mention",
+                "text": "<@U0123456789> 来週勉強会をしたいです <!channel>",
+                "user": "U0123456789",
+                "channel": "C1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="study_session"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "app_mention",
+                "text": "<@U0123456789> MTGの予定を調整してください",
+                "user": "U0123456789",
+                "channel": "C1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="meeting"
+    )
+]
+
+
+class TestSlackBotMentions:
+    """Test Slack bot mention events contract."""
 
     @pytest.fixture
     def bot_mention_with_thread_payload(self) -> Dict[str, Any]:
@@ -82,20 +180,12 @@ class TestSlackBotMentions:
             }
         }
 
-    def test_bot_mention_success(
-        self,
-        client: TestClient,
-        bot_mention_payload: Dict[str, Any]
-    ) -> None:
+    def test_bot_mention_success(self, client: TestClient) -> None:
         """Test successful bot mention event processing."""
         response = client.post(
             "/slack/events",
-            json=bot_mention_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=_BOT_MENTION_BYTES,
+            headers=slack_headers(_BOT_MENTION_BYTES)
         )
 
         # Should acknowledge event quickly
@@ -108,14 +198,11 @@ class TestSlackBotMentions:
         bot_mention_with_thread_payload: Dict[str, Any]
     ) -> None:
         """Test bot mention in thread (intermediate confirmation)."""
+        body = orjson.dumps(bot_mention_with_thread_payload)
         response = client.post(
             "/slack/events",
-            json=bot_mention_with_thread_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Should process thread messages for confirmations
@@ -128,144 +215,63 @@ class TestSlackBotMentions:
         bot_mention_with_participants_payload: Dict[str, Any]
     ) -> None:
         """Test bot mention with @here participant specification."""
+        body = orjson.dumps(bot_mention_with_participants_payload)
         response = client.post(
             "/slack/events",
-            json=bot_mention_with_participants_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Should handle @here/@channel mentions
         assert response.status_code == 200
         assert response.text == "OK"
 
-    def test_bot_mention_missing_required_fields(self, client: TestClient) -> None:
-        """Test bot mention with missing required fields."""
-        invalid_payloads = [
-            # Missing user field
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "app_mention",
-                    "text": "<@U0123456789> test",
-                    "channel": "C1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Missing channel field
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "app_mention",
-                    "text": "<@U0123456789> test",
-                    "user": "U0123456789",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Missing text field
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "app_mention",
-                    "user": "U0123456789",
-                    "channel": "C1234567890",
-                    "ts": "1234567890.123456"
-                }
-            }
-        ]
-
-        for payload in invalid_payloads:
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Slack-Signature": "v0=test_signature",
-                    "X-Slack-Request-Timestamp": "1234567890"
-                }
-            )
-
-            # Should handle invalid payloads gracefully
-            assert response.status_code in [200, 400]
-
-    def test_bot_mention_invalid_signature(
-        self,
-        client: TestClient,
-        bot_mention_payload: Dict[str, Any]
-    ) -> None:
-        """Test bot mention with invalid Slack signature."""
-        response = client.post(
-            "/slack/events",
-            json=bot_mention_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=invalid_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
-        )
-
-        # Should reject invalid signatures
-        assert response.status_code == 401
-
-    def test_bot_mention_missing_signature(
+    @pytest.mark.parametrize("payload", _MISSING_FIELD_PAYLOADS)
+    def test_bot_mention_missing_required_fields(
         self,
         client: TestClient,
-        bot_mention_payload: Dict[str, Any]
+        payload: Dict[str, Any]
     ) -> None:
-        """Test bot mention without Slack signature headers."""
+        """Test bot mention with missing required fields."""
+        body = orjson.dumps(payload)
         response = client.post(
             "/slack/events",
-            json=bot_mention_payload,
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=slack_headers(body)
         )
 
-        # Should require signature verification
-        assert response.status_code == 401
+        # Should handle invalid payloads gracefully
+        assert response.status_code in [200, 400]
 
-    def test_bot_mention_old_timestamp(
+    @pytest.mark.parametrize("build_headers", _SIGNATURE_REJECTION_CASES)
+    def test_bot_mention_signature_rejection(
         self,
         client: TestClient,
-        bot_mention_payload: Dict[str, Any]
+        slack_signer: Signer,
+        build_headers: Callable[[bytes, Signer], Dict[str, str]]
     ) -> None:
-        """Test bot mention with old timestamp (replay attack protection)."""
-        import time
-        old_timestamp = str(int(time.time()) - 400)  # 400 seconds ago
-
+        """Test bot mention with invalid, missing or replayed Slack signatures."""
         response = client.post(
             "/slack/events",
-            json=bot_mention_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": old_timestamp
-            }
+            content=_BOT_MENTION_BYTES,
+            headers=build_headers(_BOT_MENTION_BYTES, slack_signer)
         )
 
-        # Should reject old timestamps (> 5 minutes)
+        # Should reject requests failing signature verification
         assert response.status_code == 401
 
     @pytest.mark.asyncio
     async def test_bot_mention_response_time(
         self,
-        client: TestClient,
-        bot_mention_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test bot mention response time compliance."""
-        import time
-
         start_time = time.time()
 
         response = client.post(
             "/slack/events",
-            json=bot_mention_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": str(int(time.time()))
-            }
+            content=_BOT_MENTION_BYTES,
+            headers=slack_headers(_BOT_MENTION_BYTES)
         )
 
         end_time = time.time()
@@ -275,20 +281,12 @@ class TestSlackBotMentions:
         assert response_time < 3.0
         assert response.status_code == 200
 
-    def test_bot_mention_contract_compliance(
-        self,
-        client: TestClient,
-        bot_mention_payload: Dict[str, Any]
-    ) -> None:
+    def test_bot_mention_contract_compliance(self, client: TestClient) -> None:
         """Test contract compliance with OpenAPI specification."""
         response = client.post(
             "/slack/events",
-            json=bot_mention_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": str(int(__import__("time").time()))
-            }
+            content=_BOT_MENTION_BYTES,
+            headers=slack_headers(_BOT_MENTION_BYTES)
         )
 
         # Validate response matches contract spec
@@ -298,55 +296,20 @@ class TestSlackBotMentions:
         # Response should be plain text
         assert response.headers.get("content-type", "").startswith("text/plain")
 
-    def test_bot_mention_japanese_text_handling(self, client: TestClient) -> None:
+    @pytest.mark.parametrize("payload", _JAPANESE_MENTION_PAYLOADS)
+    def test_bot_mention_japanese_text_handling(
+        self,
+        client: TestClient,
+        payload: Dict[str, Any]
+    ) -> None:
         """Test bot mention with Japanese text and event types."""
-        japanese_payloads = [
-            # Dining event
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "app_mention",
-                    "text": "<@U0123456789> 今度チームでランチしませんか <@U1111111111>",
-                    "user": "U0123456789",
-                    "channel": "C1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Study session
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "app_mention",
-                    "text": "<@U0123456789> 来週勉強会をしたいです <!channel>",
-                    "user": "U0123456789",
-                    "channel": "C1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Meeting
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "app_mention",
-                    "text": "<@U0123456789> MTGの予定を調整してください",
-                    "user": "U0123456789",
-                    "channel": "C1234567890",
-                    "ts": "1234567890.123456"
-                }
-            }
-        ]
-
-        for payload in japanese_payloads:
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Slack-Signature": "v0=test_signature",
-                    "X-Slack-Request-Timestamp": str(int(__import__("time").time()))
-                }
-            )
-
-            # Should handle Japanese text correctly
-            assert response.status_code == 200
-            assert response.text == "OK"
\ No newline at end of file
+        body = orjson.dumps(payload)
+        response = client.post(
+            "/slack/events",
+            content=body,
+            headers=slack_headers(body)
+        )
+
+        # Should handle Japanese text correctly
+        assert response.status_code == 200
+        assert response.text == "OK"
@@ -8,133 +8,315 @@ to the Slack Events API specification.
 Reference: specs/002-slack-bot-ai/contracts/slack_events.yaml
 """
 
-from typing import Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-# NOTE: These imports will fail until implementation exists (TDD)
-# This is expected and required for TDD approach
-try:
-    from src.integrations.slack_handler import SlackEventHandler
-    from src.main import app
-except ImportError:
-    # Expected during TDD phase - tests should fail first
-    pytest.skip("Implementation not yet available", allow_module_level=True)
-
-
-class TestSlackDirectMessages:
-    """Test Slack direct message events contract."""
-
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client for Slack event endpoint."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def dm_confirmation_payload(self) -> Dict[str, Any]:
-        """Direct message confirmation payload."""
-        return {
+from tests.contract.slack_common import (
+    Signer,
+    encode_params,
+    invalid_signature_headers,
+    missing_signature_headers,
+    signed_headers,
+    slack_headers
+)
+
+# NOTE: Tests are skipped until the implementation (src.main) exists (TDD)
+# The check runs once in conftest; the app is imported lazily by fixtures
+pytestmark = pytest.mark.requires_app
+
+
+_TS = "1234567890.123456"
+
+
+def _dm_payload(
+    text: str,
+    user: Optional[str],
+    channel: str,
+    **event_extra: Any
+) -> Dict[str, Any]:
+    """Build a DM ``event_callback`` payload; ``user=None`` omits the sender."""
+    event: Dict[str, Any] = {"type": "message", "channel_type": "im", "text": text}
+    if user is not None:
+        event["user"] = user
+    event.update(channel=channel, ts=_TS, event_ts=_TS, **event_extra)
+    return {
+        "type": "event_callback",
+        "team_id": "T1234567890",
+        "api_app_id": "A1234567890",
+        "event": event
+    }
+
+
+# Direct message confirmation payload
+_DM_CONFIRMATION = _dm_payload("はい、参加します！", "U1111111111", "D1234567890")
+
+# Direct message decline payload
+_DM_DECLINE = _dm_payload(
+    "すみません、その日は都合が悪いです", "U2222222222", "D1234567891"
+)
+
+# Direct message availability response payload
+_DM_AVAILABILITY = _dm_payload(
+    "来週の火曜日と木曜日なら空いています", "U3333333333", "D1234567892"
+)
+
+# Direct message schedule query payload
+_DM_SCHEDULE_QUERY = _dm_payload(
+    "次回のランチ会はいつですか？", "U4444444444", "D1234567893"
+)
+
+# Bot-sent message (should be ignored)
+_DM_BOT_MESSAGE = _dm_payload(
+    "イベントが確定しました！", None, "D1234567894", bot_id="B0123456789"
+)
+
+# Payloads are sent as-is, so serialize them once at import
+_DM_CONFIRMATION_BYTES = orjson.dumps(_DM_CONFIRMATION)
+_DM_DECLINE_BYTES = orjson.dumps(_DM_DECLINE)
+_DM_AVAILABILITY_BYTES = orjson.dumps(_DM_AVAILABILITY)
+_DM_SCHEDULE_QUERY_BYTES = orjson.dumps(_DM_SCHEDULE_QUERY)
+_DM_BOT_MESSAGE_BYTES = orjson.dumps(_DM_BOT_MESSAGE)
+
+
+_MISSING_FIELD_PAYLOADS = [
+    pytest.param(
+        {
             "type": "event_callback",
-            "team_id": "T1234567890",
-            "api_app_id": "A1234567890",
             "event": {
                 "type": "message",
                 "channel_type": "im",
-                "text": "はい、参加します！",
-                "user": "U1111111111",
-                "channel": "D1234567890",  # DM channel
-                "ts": "1234567890.123456",
-                "event_ts": "1234567890.123456"
+                "text": "test message",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
             }
-        }
-
-    @pytest.fixture
-    def dm_decline_payload(self) -> Dict[str, Any]:
-        """Direct message decline payload."""
-        return {
+        },
+        id="missing_user"
+    ),
+    pytest.param(
+        {
             "type": "event_callback",
-            "team_id": "T1234567890",
-            "api_app_id": "A1234567890",
             "event": {
                 "type": "message",
                 "channel_type": "im",
-                "text": "すみません、その日は都合が悪いです",
-                "user": "U2222222222",
-                "channel": "D1234567891",
-                "ts": "1234567890.123456",
-                "event_ts": "1234567890.123456"
+                "text": "test message",
+                "user": "U0123456789",
+                "ts": "1234567890.123456"
             }
-        }
-
-    @pytest.fixture
-    def dm_availability_payload(self) -> Dict[str, Any]:
-        """Direct message availability response payload."""
-        return {
+        },
+        id="missing_channel"
+    ),
+    pytest.param(
+        {
             "type": "event_callback",
-            "team_id": "T1234567890",
-            "api_app_id": "A1234567890",
             "event": {
                 "type": "message",
                 "channel_type": "im",
-                "text": "来週の火曜日と木曜日なら空いています",
-                "user": "U3333333333",
-                "channel": "D1234567892",
-                "ts": "1234567890.123456",
-                "event_ts": "1234567890.123456"
+                "user": "U0123456789",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
             }
-        }
-
-    @pytest.fixture
-    def dm_schedule_query_payload(self) -> Dict[str, Any]:
-        """Direct message schedule query payload."""
-        return {
+        },
+        id="missing_text"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "channel_type": "channel",
+                "text": "test message",
+                "user": "U0123456789",
+                "channel": "C1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="wrong_channel_type"
+    )
+]
+
+_MESSAGE_SUBTYPE_PAYLOADS = [
+    pytest.param(
+        {
             "type": "event_callback",
-            "team_id": "T1234567890",
-            "api_app_id": "A1234567890",
             "event": {
                 "type": "message",
                 "channel_type": "im",
-                "text": "次回のランチ会はいつですか？",
-                "user": "U4444444444",
-                "channel": "D1234567893",
-                "ts": "1234567890.123456",
-                "event_ts": "1234567890.123456"
+                "text": "参加します",
+                "user": "U0123456789",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
             }
-        }
-
-    @pytest.fixture
-    def dm_bot_message_payload(self) -> Dict[str, Any]:
-        """Bot-sent message (should be ignored)."""
-        return {
+        },
+        id="regular"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "subtype": "message_changed",
+                "channel_type": "im",
+                "message": {
+                    "text": "やっぱり参加できません",
+                    "user": "U0123456789"
+                },
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="message_changed"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "subtype": "message_deleted",
+                "channel_type": "im",
+                "deleted_ts": "1234567890.123000",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="message_deleted"
+    ),
+    pytest.param(
+        {
             "type": "event_callback",
-            "team_id": "T1234567890",
-            "api_app_id": "A1234567890",
             "event": {
                 "type": "message",
+                "subtype": "file_share",
                 "channel_type": "im",
-                "text": "イベントが確定しました！",
-                "bot_id": "B0123456789",  # Bot message
-                "channel": "D1234567894",
+                "text": "スケジュール表を送りました",
+                "user": "U0123456789",
+                "channel": "D1234567890",
                 "ts": "1234567890.123456",
-                "event_ts": "1234567890.123456"
+                "files": [{"id": "F1234567890"}]
+            }
+        },
+        id="file_share"
+    )
+]
+
+_MISSING_FIELD_BODIES = encode_params(_MISSING_FIELD_PAYLOADS)
+_MESSAGE_SUBTYPE_BODIES = encode_params(_MESSAGE_SUBTYPE_PAYLOADS)
+
+_JAPANESE_RESPONSE_TEXTS = (
+    # Confirmation patterns
+    "はい、参加します",
+    "参加します！",
+    "ぜひ参加したいです",
+    "OK、参加で",
+
+    # Decline patterns
+    "すみません、参加できません",
+    "その日は無理です",
+    "都合が悪いです",
+    "不参加で",
+
+    # Availability patterns
+    "火曜日なら空いています",
+    "来週の金曜日はどうですか？",
+    "平日の夕方が良いです",
+
+    # Questions
+    "何時からですか？",
+    "場所はどこですか？",
+    "持ち物はありますか？",
+
+    # Mixed language
+    "Sorry、その日は busy です",
+    "Meeting room の予約はできますか？"
+)
+
+_JAPANESE_RESPONSE_BODIES = [
+    pytest.param(
+        orjson.dumps(_dm_payload(text, "U0123456789", "D1234567890")), id=text
+    )
+    for text in _JAPANESE_RESPONSE_TEXTS
+]
+
+# Very long DM body for the edge-case test
+_LONG_JP = "参加します！" * 100
+
+_EDGE_CASE_PAYLOADS = [
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "channel_type": "im",
+                "text": "",
+                "user": "U0123456789",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="empty"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "channel_type": "im",
+                "text": _LONG_JP,
+                "user": "U0123456789",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="very_long"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "channel_type": "im",
+                "text": "👍",
+                "user": "U0123456789",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
+            }
+        },
+        id="emoji_only"
+    ),
+    pytest.param(
+        {
+            "type": "event_callback",
+            "event": {
+                "type": "message",
+                "channel_type": "im",
+                "text": "はい、<@U1234567890> さんと参加します",
+                "user": "U0123456789",
+                "channel": "D1234567890",
+                "ts": "1234567890.123456"
             }
-        }
+        },
+        id="with_mention"
+    )
+]
+_EDGE_CASE_BODIES = encode_params(_EDGE_CASE_PAYLOADS)
+
+
+class TestSlackDirectMessages:
+    """Test Slack direct message events contract."""
 
     def test_dm_confirmation_success(
         self,
-        client: TestClient,
-        dm_confirmation_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test successful DM confirmation processing."""
         response = client.post(
             "/slack/events",
-            json=dm_confirmation_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=_DM_CONFIRMATION_BYTES,
+            headers=slack_headers(_DM_CONFIRMATION_BYTES)
         )
 
         # Should acknowledge event quickly
@@ -143,18 +325,13 @@ class TestSlackDirectMessages:
 
     def test_dm_decline_handling(
         self,
-        client: TestClient,
-        dm_decline_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test DM decline response handling."""
         response = client.post(
             "/slack/events",
-            json=dm_decline_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=_DM_DECLINE_BYTES,
+            headers=slack_headers(_DM_DECLINE_BYTES)
         )
 
         # Should process decline responses
@@ -163,18 +340,13 @@ class TestSlackDirectMessages:
 
     def test_dm_availability_response(
         self,
-        client: TestClient,
-        dm_availability_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test availability response in DM."""
         response = client.post(
             "/slack/events",
-            json=dm_availability_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=_DM_AVAILABILITY_BYTES,
+            headers=slack_headers(_DM_AVAILABILITY_BYTES)
         )
 
         # Should process availability information
@@ -183,18 +355,13 @@ class TestSlackDirectMessages:
 
     def test_dm_schedule_query(
         self,
-        client: TestClient,
-        dm_schedule_query_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test schedule query in DM."""
         response = client.post(
             "/slack/events",
-            json=dm_schedule_query_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=_DM_SCHEDULE_QUERY_BYTES,
+            headers=slack_headers(_DM_SCHEDULE_QUERY_BYTES)
         )
 
         # Should respond to queries
@@ -203,301 +370,120 @@ class TestSlackDirectMessages:
 
     def test_dm_bot_message_ignored(
         self,
-        client: TestClient,
-        dm_bot_message_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test that bot messages are ignored."""
         response = client.post(
             "/slack/events",
-            json=dm_bot_message_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=_DM_BOT_MESSAGE_BYTES,
+            headers=slack_headers(_DM_BOT_MESSAGE_BYTES)
         )
 
         # Should acknowledge but not process bot messages
         assert response.status_code == 200
         assert response.text == "OK"
 
-    def test_dm_missing_required_fields(self, client: TestClient) -> None:
+    @pytest.mark.parametrize("body", _MISSING_FIELD_BODIES)
+    def test_dm_missing_required_fields(
+        self,
+        client: TestClient,
+        body: bytes
+    ) -> None:
         """Test DM with missing required fields."""
-        invalid_payloads = [
-            # Missing user field
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "test message",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Missing channel field
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "test message",
-                    "user": "U0123456789",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Missing text field
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Wrong channel type (not DM)
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "channel",
-                    "text": "test message",
-                    "user": "U0123456789",
-                    "channel": "C1234567890",
-                    "ts": "1234567890.123456"
-                }
-            }
-        ]
-
-        for payload in invalid_payloads:
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Slack-Signature": "v0=test_signature",
-                    "X-Slack-Request-Timestamp": "1234567890"
-                }
-            )
-
-            # Should handle invalid payloads gracefully
-            assert response.status_code in [200, 400]
-
-    def test_dm_message_subtypes(self, client: TestClient) -> None:
-        """Test different DM message subtypes."""
-        message_subtypes = [
-            # Regular message (no subtype)
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "参加します",
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Message edit (should be processed)
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "subtype": "message_changed",
-                    "channel_type": "im",
-                    "message": {
-                        "text": "やっぱり参加できません",
-                        "user": "U0123456789"
-                    },
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Message deletion (should be ignored)
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "subtype": "message_deleted",
-                    "channel_type": "im",
-                    "deleted_ts": "1234567890.123000",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # File upload message
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "subtype": "file_share",
-                    "channel_type": "im",
-                    "text": "スケジュール表を送りました",
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456",
-                    "files": [{"id": "F1234567890"}]
-                }
-            }
-        ]
-
-        for payload in message_subtypes:
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Slack-Signature": "v0=test_signature",
-                    "X-Slack-Request-Timestamp": "1234567890"
-                }
-            )
-
-            # All should be handled appropriately
-            assert response.status_code == 200
-            assert response.text == "OK"
-
-    def test_dm_japanese_response_patterns(self, client: TestClient) -> None:
-        """Test various Japanese response patterns in DMs."""
-        japanese_responses = [
-            # Confirmation patterns
-            {"text": "はい、参加します"},
-            {"text": "参加します！"},
-            {"text": "ぜひ参加したいです"},
-            {"text": "OK、参加で"},
-
-            # Decline patterns
-            {"text": "すみません、参加できません"},
-            {"text": "その日は無理です"},
-            {"text": "都合が悪いです"},
-            {"text": "不参加で"},
-
-            # Availability patterns
-            {"text": "火曜日なら空いています"},
-            {"text": "来週の金曜日はどうですか？"},
-            {"text": "平日の夕方が良いです"},
-
-            # Questions
-            {"text": "何時からですか？"},
-            {"text": "場所はどこですか？"},
-            {"text": "持ち物はありますか？"},
-
-            # Mixed language
-            {"text": "Sorry、その日は busy です"},
-            {"text": "Meeting room の予約はできますか？"}
-        ]
-
-        for response_data in japanese_responses:
-            payload = {
-                "type": "event_callback",
-                "team_id": "T1234567890",
-                "api_app_id": "A1234567890",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": response_data["text"],
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456",
-                    "event_ts": "1234567890.123456"
-                }
-            }
-
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Slack-Signature": "v0=test_signature",
-                    "X-Slack-Request-Timestamp": "1234567890"
-                }
-            )
+        response = client.post(
+            "/slack/events",
+            content=body,
+            headers=slack_headers(body)
+        )
 
-            # Should handle all Japanese response patterns
-            assert response.status_code == 200
-            assert response.text == "OK"
+        # Should handle invalid payloads gracefully
+        assert response.status_code in [200, 400]
 
-    def test_dm_signature_verification(
+    @pytest.mark.parametrize("body", _MESSAGE_SUBTYPE_BODIES)
+    def test_dm_message_subtypes(
         self,
         client: TestClient,
-        dm_confirmation_payload: Dict[str, Any]
+        body: bytes
     ) -> None:
-        """Test DM signature verification requirements."""
-        # Valid signature
+        """Test different DM message subtypes."""
         response = client.post(
             "/slack/events",
-            json=dm_confirmation_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=body,
+            headers=slack_headers(body)
         )
+
+        # All should be handled appropriately
         assert response.status_code == 200
+        assert response.text == "OK"
 
-        # Invalid signature
+    @pytest.mark.parametrize("body", _JAPANESE_RESPONSE_BODIES)
+    def test_dm_japanese_response_patterns(
+        self,
+        client: TestClient,
+        body: bytes
+    ) -> None:
+        """Test various Japanese response patterns in DMs."""
         response = client.post(
             "/slack/events",
-            json=dm_confirmation_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=invalid_signature",
-                "X-Slack-Request-Timestamp": "1234567890"
-            }
+            content=body,
+            headers=slack_headers(body)
         )
-        assert response.status_code == 401
 
-        # Missing signature
+        # Should handle all Japanese response patterns
+        assert response.status_code == 200
+        assert response.text == "OK"
+
+    @pytest.mark.parametrize(
+        "build_headers, expected_status",
+        [
+            pytest.param(signed_headers, 200, id="valid_signature"),
+            pytest.param(invalid_signature_headers, 401, id="invalid_signature"),
+            pytest.param(missing_signature_headers, 401, id="missing_signature")
+        ]
+    )
+    def test_dm_signature_verification(
+        self,
+        client: TestClient,
+        slack_signer: Signer,
+        build_headers: Callable[[bytes, Signer], Dict[str, str]],
+        expected_status: int
+    ) -> None:
+        """Test DM signature verification requirements."""
         response = client.post(
             "/slack/events",
-            json=dm_confirmation_payload,
-            headers={"Content-Type": "application/json"}
+            content=_DM_CONFIRMATION_BYTES,
+            headers=build_headers(_DM_CONFIRMATION_BYTES, slack_signer)
         )
-        assert response.status_code == 401
+        assert response.status_code == expected_status
 
-    @pytest.mark.asyncio
-    async def test_dm_response_time_compliance(
+    def test_dm_response_time_compliance(
         self,
-        client: TestClient,
-        dm_confirmation_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test DM response time compliance."""
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         response = client.post(
             "/slack/events",
-            json=dm_confirmation_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": str(int(time.time()))
-            }
+            content=_DM_CONFIRMATION_BYTES,
+            headers=slack_headers(_DM_CONFIRMATION_BYTES)
         )
 
-        end_time = time.time()
-        response_time = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
         # Slack requires acknowledgment within 3 seconds
-        assert response_time < 3.0
+        assert elapsed_ns < 3_000_000_000
         assert response.status_code == 200
 
     def test_dm_contract_compliance(
         self,
-        client: TestClient,
-        dm_confirmation_payload: Dict[str, Any]
+        client: TestClient
     ) -> None:
         """Test contract compliance with OpenAPI specification."""
         response = client.post(
             "/slack/events",
-            json=dm_confirmation_payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-Slack-Signature": "v0=test_signature",
-                "X-Slack-Request-Timestamp": str(int(__import__("time").time()))
-            }
+            content=_DM_CONFIRMATION_BYTES,
+            headers=slack_headers(_DM_CONFIRMATION_BYTES)
         )
 
         # Validate response matches contract spec
@@ -507,69 +493,43 @@ class TestSlackDirectMessages:
         # Response should be plain text
         assert response.headers.get("content-type", "").startswith("text/plain")
 
-    def test_dm_edge_cases(self, client: TestClient) -> None:
+    @pytest.mark.parametrize("body", _EDGE_CASE_BODIES)
+    def test_dm_edge_cases(
+        self,
+        client: TestClient,
+        body: bytes
+    ) -> None:
         """Test DM edge cases and boundary conditions."""
-        edge_cases = [
-            # Empty message
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "",
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Very long message
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "参加します！" * 100,
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Message with only emoji
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "👍",
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            },
-            # Message with mentions
-            {
-                "type": "event_callback",
-                "event": {
-                    "type": "message",
-                    "channel_type": "im",
-                    "text": "はい、<@U1234567890> さんと参加します",
-                    "user": "U0123456789",
-                    "channel": "D1234567890",
-                    "ts": "1234567890.123456"
-                }
-            }
+        response = client.post(
+            "/slack/events",
+            content=body,
+            headers=slack_headers(body)
+        )
+
+        # All edge cases should be handled gracefully
+        assert response.status_code in [200, 400]
+
+    @pytest.mark.slow
+    def test_dm_batch_ack(
+        self,
+        client: TestClient,
+        pool: ThreadPoolExecutor
+    ) -> None:
+        """Fire every Japanese-pattern and edge-case DM at once and check the acks.
+
+        Opt-in (``-m slow``): it re-sends the parametrized DMs concurrently.
+        """
+        cases = [
+            *((p.id, p.values[0], (200,)) for p in _JAPANESE_RESPONSE_BODIES),
+            *((p.id, p.values[0], (200, 400)) for p in _EDGE_CASE_BODIES)
         ]
 
-        for payload in edge_cases:
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Slack-Signature": "v0=test_signature",
-                    "X-Slack-Request-Timestamp": str(int(__import__("time").time()))
-                }
-            )
+        def send(body: bytes) -> Any:
+            return client.post("/slack/events", content=body, headers=slack_headers(body))
 
-            # All edge cases should be handled gracefully
-            assert response.status_code in [200, 400]
\ No newline at end of file
+        responses = list(pool.map(send, (body for _, body, _ in cases)))
+
+        for (case_id, _, expected), response in zip(cases, responses, strict=True):
+            assert response.status_code in expected, (
+                f"{case_id}: got {response.status_code}, expected one of {expected}"
+            )
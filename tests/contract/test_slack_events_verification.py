@@ -3,42 +3,52 @@ Contract test for Slack Event API URL verification.
 
 This test validates that our Slack event handler correctly processes
 URL verification challenges according to the Slack Events API specification.
+Slack signs url_verification requests like any other event, so every request
+here carries a valid signature and the handler gets no bypass.
 
 Reference: specs/002-slack-bot-ai/contracts/slack_events.yaml
 """
 
-import json
+import time
 from typing import Any, Dict
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-# NOTE: These imports will fail until implementation exists (TDD)
-# This is expected and required for TDD approach
-try:
-    from src.integrations.slack_handler import SlackEventHandler
-    from src.main import app
-except ImportError:
-    # Expected during TDD phase - tests should fail first
-    pytest.skip("Implementation not yet available", allow_module_level=True)
+from tests.contract.slack_common import slack_headers
+
+# NOTE: Tests are skipped until the implementation (src.main) exists (TDD)
+# The check runs once in conftest; the app is imported lazily by fixtures
+pytestmark = pytest.mark.requires_app
+
+
+_EDGE_CASE_PAYLOADS = (
+    pytest.param({"type": "url_verification", "challenge": ""}, id="empty"),
+    pytest.param(
+        {"type": "url_verification", "challenge": "x" * 1000}, id="very_long"
+    ),
+    pytest.param(
+        {"type": "url_verification", "challenge": "test-_=+&%$#@!"},
+        id="special_chars"
+    ),
+    pytest.param(
+        {"type": "url_verification", "challenge": "test🚀挑戦"}, id="unicode"
+    ),
+    pytest.param(
+        {
+            "type": "url_verification",
+            "challenge": "test",
+            "unexpected_field": "should_be_ignored"
+        },
+        id="extra_field"
+    )
+)
 
 
 class TestSlackEventVerification:
     """Test Slack Events API URL verification contract."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client for Slack event endpoint."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def url_verification_payload(self) -> Dict[str, Any]:
-        """Valid URL verification challenge payload."""
-        return {
-            "type": "url_verification",
-            "challenge": "test_challenge_string_12345"
-        }
-
     @pytest.fixture
     def invalid_verification_payload(self) -> Dict[str, Any]:
         """Invalid verification payload missing challenge."""
@@ -53,10 +63,11 @@ class TestSlackEventVerification:
         url_verification_payload: Dict[str, Any]
     ) -> None:
         """Test successful URL verification challenge response."""
+        body = orjson.dumps(url_verification_payload)
         response = client.post(
             "/slack/events",
-            json=url_verification_payload,
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Should return challenge string as plain text
@@ -70,10 +81,11 @@ class TestSlackEventVerification:
         invalid_verification_payload: Dict[str, Any]
     ) -> None:
         """Test URL verification with missing challenge field."""
+        body = orjson.dumps(invalid_verification_payload)
         response = client.post(
             "/slack/events",
-            json=invalid_verification_payload,
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Should return 400 Bad Request for invalid payload
@@ -87,10 +99,11 @@ class TestSlackEventVerification:
             "challenge": "test_challenge"
         }
 
+        body = orjson.dumps(payload)
         response = client.post(
             "/slack/events",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Should return 400 Bad Request for invalid type
@@ -98,10 +111,11 @@ class TestSlackEventVerification:
 
     def test_url_verification_malformed_json(self, client: TestClient) -> None:
         """Test URL verification with malformed JSON."""
+        body = b"invalid json"
         response = client.post(
             "/slack/events",
-            data="invalid json",
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Should return 400 Bad Request for malformed JSON
@@ -113,38 +127,36 @@ class TestSlackEventVerification:
         url_verification_payload: Dict[str, Any]
     ) -> None:
         """Test URL verification without Content-Type header."""
-        response = client.post(
-            "/slack/events",
-            data=json.dumps(url_verification_payload)
-            # Missing Content-Type header
-        )
+        body = orjson.dumps(url_verification_payload)
+        headers = slack_headers(body)
+        del headers["Content-Type"]
+
+        response = client.post("/slack/events", content=body, headers=headers)
 
         # Should handle missing content type gracefully
         # Implementation should still process valid JSON
         assert response.status_code in [200, 400]  # Depends on implementation
 
-    @pytest.mark.asyncio
-    async def test_url_verification_performance(
+    def test_url_verification_performance(
         self,
         client: TestClient,
         url_verification_payload: Dict[str, Any]
     ) -> None:
         """Test URL verification response time performance."""
-        import time
-
-        start_time = time.time()
+        body = orjson.dumps(url_verification_payload)
+        headers = slack_headers(body)
+        start_ns = time.perf_counter_ns()
 
         response = client.post(
             "/slack/events",
-            json=url_verification_payload,
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=headers
         )
 
-        end_time = time.time()
-        response_time = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
         # Slack requires response within 3 seconds
-        assert response_time < 3.0
+        assert elapsed_ns < 3_000_000_000
         assert response.status_code == 200
 
     def test_url_verification_contract_compliance(
@@ -153,10 +165,11 @@ class TestSlackEventVerification:
         url_verification_payload: Dict[str, Any]
     ) -> None:
         """Test contract compliance with OpenAPI specification."""
+        body = orjson.dumps(url_verification_payload)
         response = client.post(
             "/slack/events",
-            json=url_verification_payload,
-            headers={"Content-Type": "application/json"}
+            content=body,
+            headers=slack_headers(body)
         )
 
         # Validate response matches contract spec
@@ -173,39 +186,23 @@ class TestSlackEventVerification:
         for header in forbidden_headers:
             assert header not in response.headers
 
-    def test_url_verification_edge_cases(self, client: TestClient) -> None:
+    @pytest.mark.parametrize("payload", _EDGE_CASE_PAYLOADS)
+    def test_url_verification_edge_cases(
+        self,
+        client: TestClient,
+        payload: Dict[str, Any]
+    ) -> None:
         """Test URL verification edge cases and boundary conditions."""
-        test_cases = [
-            # Empty challenge
-            {"type": "url_verification", "challenge": ""},
-
-            # Very long challenge
-            {"type": "url_verification", "challenge": "x" * 1000},
-
-            # Challenge with special characters
-            {"type": "url_verification", "challenge": "test-_=+&%$#@!"},
-
-            # Challenge with unicode
-            {"type": "url_verification", "challenge": "test🚀挑戦"},
-
-            # Additional unexpected fields
-            {
-                "type": "url_verification",
-                "challenge": "test",
-                "unexpected_field": "should_be_ignored"
-            }
-        ]
-
-        for payload in test_cases:
-            response = client.post(
-                "/slack/events",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-
-            # All should succeed and return the challenge
-            if payload["challenge"]:  # Non-empty challenges
-                assert response.status_code == 200
-                assert response.text == payload["challenge"]
-            else:  # Empty challenge might be rejected
-                assert response.status_code in [200, 400]
\ No newline at end of file
+        body = orjson.dumps(payload)
+        response = client.post(
+            "/slack/events",
+            content=body,
+            headers=slack_headers(body)
+        )
+
+        # All should succeed and return the challenge
+        if payload["challenge"]:  # Non-empty challenges
+            assert response.status_code == 200
+            assert response.text == payload["challenge"]
+        else:  # Empty challenge might be rejected
+            assert response.status_code in [200, 400]
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import asyncio
+from typing import Iterator
+
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "slow: memory/perf-only tests, excluded from per-commit CI"
+    )
+
+
+@pytest.fixture
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Run async unit tests on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+
+    yield loop
+    loop.close()
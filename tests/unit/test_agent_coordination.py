@@ -4,6 +4,7 @@ Tests the core multi-agent communication and workflow orchestration
 """
 
 import asyncio
+import time
 import pytest
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
@@ -24,16 +25,65 @@ from src.models.event import Event, EventType, EventStatus
 from src.models.participant import Participant, ParticipationStatus
 from src.models.coordination_session import CoordinationSession, CoordinationPhase, CoordinationStatus
 
+# Fixed timestamp so shared fixture data is reproducible
+_FIXED_DT = datetime(2024, 1, 1)
+
+# Successful phase results shared by the mocked agents (read-only)
+_OK_PARTICIPANT_PHASE = {"success": True, "confirmed_participants": 5}
+_OK_SCHEDULING_PHASE = {"success": True, "selected_schedule": {"start": _FIXED_DT}}
+_OK_VENUE_PHASE = {"success": True, "selected_venue": {"name": "Test Venue"}}
+_OK_CALENDAR_PHASE = {"success": True, "calendar_event": {"id": "test_event"}}
+
+
+@pytest.fixture(scope="module")
+def coordination_agent():
+    """Create coordination agent instance shared by the module"""
+    return CoordinationAgent()
+
+
+@pytest.fixture(autouse=True)
+def _restore_message_handlers(coordination_agent):
+    """Undo per-test handler overrides on the shared coordination agent"""
+    handlers = dict(coordination_agent.message_handlers)
+    yield
+    coordination_agent.message_handlers.clear()
+    coordination_agent.message_handlers.update(handlers)
+
+
+@pytest.fixture(scope="module")
+def event_template():
+    """Validated Event copied per test instead of rebuilt field by field"""
+    return Event(
+        event_id="tmpl",
+        title="tmpl",
+        event_type=EventType.DINING,
+        organizer_id="tmpl",
+        participants=[],
+        status=EventStatus.PLANNING,
+        created_at=_FIXED_DT,
+        updated_at=_FIXED_DT
+    )
+
+
+@pytest.fixture(scope="module")
+def session_template(event_template):
+    """Validated CoordinationSession copied per test instead of rebuilt field by field"""
+    return CoordinationSession(
+        session_id="tmpl",
+        event_id=event_template.event_id,
+        event=event_template,
+        current_phase=CoordinationPhase.PARTICIPANT_CONFIRMATION,
+        status=CoordinationStatus.IN_PROGRESS,
+        agent_states={},
+        created_at=_FIXED_DT,
+        updated_at=_FIXED_DT
+    )
+
 
 class TestAgentCommunication:
     """Test agent communication protocols and message passing"""
 
-    @pytest.fixture
-    def coordination_agent(self):
-        """Create coordination agent instance"""
-        return CoordinationAgent()
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def participant_agent(self):
         """Create participant agent instance"""
         return ParticipantAgent()
@@ -140,11 +190,11 @@ class TestWorkflowOrchestration:
             updated_at=datetime.now()
         )
 
-    @pytest.fixture
-    def agents_system(self):
+    @pytest.fixture(scope="module")
+    def agents_system(self, coordination_agent):
         """Create complete multi-agent system"""
         return {
-            "coordination": CoordinationAgent(),
+            "coordination": coordination_agent,
             "participant": ParticipantAgent(),
             "scheduling": SchedulingAgent(),
             "venue": VenueAgent(),
@@ -158,7 +208,7 @@ class TestWorkflowOrchestration:
 
         # Mock phase completion
         with patch.object(coordination_agent, '_execute_participant_phase', new_callable=AsyncMock) as mock_participant:
-            mock_participant.return_value = {"success": True, "confirmed_participants": 5}
+            mock_participant.return_value = _OK_PARTICIPANT_PHASE
 
             # Execute participant phase
             result = await coordination_agent._execute_coordination_phase(
@@ -176,6 +226,9 @@ class TestWorkflowOrchestration:
         # Test dependency graph
         dependencies = coordination_agent._get_agent_dependencies()
 
+        # The graph is built once and shared, not rebuilt per call
+        assert dependencies is coordination_agent._get_agent_dependencies()
+
         # Verify coordination is root
         assert "coordination_agent" not in dependencies
 
@@ -212,53 +265,50 @@ class TestWorkflowOrchestration:
         venue_agent = agents_system["venue"]
 
         # Mock primary API failure with successful fallback
-        with patch.object(venue_agent, '_search_google_places', new_callable=AsyncMock) as mock_google:
-            with patch.object(venue_agent, '_search_gurume_navi', new_callable=AsyncMock) as mock_gurume:
-                mock_google.side_effect = Exception("Google Places API error")
-                mock_gurume.return_value = {"success": True, "results": [{"name": "Fallback Restaurant"}]}
-
-                # Execute venue search
-                from src.agents.base_agent import AgentMessage, MessageType
-                message = AgentMessage(
-                    sender_id="coordination_agent",
-                    recipient_id="venue_agent",
-                    message_type=MessageType.VENUE_SEARCH,
-                    conversation_id="test_conversation",
-                    payload={"event_type": "dining", "participant_count": 5}
-                )
+        with patch.multiple(
+            venue_agent,
+            _search_google_places=AsyncMock(side_effect=Exception("Google Places API error")),
+            _search_gurume_navi=AsyncMock(return_value={"success": True, "results": [{"name": "Fallback Restaurant"}]})
+        ):
+            # Execute venue search
+            from src.agents.base_agent import AgentMessage, MessageType
+            message = AgentMessage(
+                sender_id="coordination_agent",
+                recipient_id="venue_agent",
+                message_type=MessageType.VENUE_SEARCH,
+                conversation_id="test_conversation",
+                payload={"event_type": "dining", "participant_count": 5}
+            )
 
-                response = await venue_agent.handle_message(message)
+            response = await venue_agent.handle_message(message)
 
-                # Verify fallback was used
-                assert response.payload["success"] is True
-                assert len(response.payload["venues"]) > 0
+            # Verify fallback was used
+            assert response.payload["success"] is True
+            assert len(response.payload["venues"]) > 0
 
 
 class TestPerformanceAndResilience:
     """Test performance characteristics and system resilience"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def performance_test_data(self):
-        """Generate test data for performance testing"""
-        participants = []
-        for i in range(50):  # Test with 50 participants
-            participant = Participant(
+        """Generate read-only test data for performance testing"""
+        return tuple(
+            Participant(
                 participant_id=f"user_{i:03d}",
                 name=f"Test User {i}",
                 email=f"user{i}@example.com",
                 slack_user_id=f"U{1000+i:04d}",
                 status=ParticipationStatus.INVITED,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
+                created_at=_FIXED_DT,
+                updated_at=_FIXED_DT
             )
-            participants.append(participant)
-
-        return participants
+            for i in range(50)  # Test with 50 participants
+        )
 
     @pytest.mark.asyncio
-    async def test_response_time_target(self, performance_test_data):
+    async def test_response_time_target(self, coordination_agent, performance_test_data):
         """Test 500ms response time target"""
-        coordination_agent = CoordinationAgent()
 
         # Create test event
         event = Event(
@@ -273,61 +323,18 @@ class TestPerformanceAndResilience:
         )
 
         # Mock fast responses from all agents
-        with patch.object(coordination_agent, '_execute_participant_phase', new_callable=AsyncMock) as mock_participant:
-            with patch.object(coordination_agent, '_execute_scheduling_phase', new_callable=AsyncMock) as mock_scheduling:
-                with patch.object(coordination_agent, '_execute_venue_phase', new_callable=AsyncMock) as mock_venue:
-                    with patch.object(coordination_agent, '_execute_calendar_phase', new_callable=AsyncMock) as mock_calendar:
-
-                        # Configure mock responses
-                        mock_participant.return_value = {"success": True, "confirmed_participants": 8}
-                        mock_scheduling.return_value = {"success": True, "selected_schedule": {"start": datetime.now()}}
-                        mock_venue.return_value = {"success": True, "selected_venue": {"name": "Test Venue"}}
-                        mock_calendar.return_value = {"success": True, "calendar_event": {"id": "test_event"}}
-
-                        # Measure coordination time
-                        start_time = datetime.now()
-
-                        session = CoordinationSession(
-                            session_id="perf_test_session",
-                            event_id=event.event_id,
-                            event=event,
-                            current_phase=CoordinationPhase.PARTICIPANT_CONFIRMATION,
-                            status=CoordinationStatus.IN_PROGRESS,
-                            agent_states={},
-                            created_at=datetime.now(),
-                            updated_at=datetime.now()
-                        )
-
-                        result = await coordination_agent._execute_full_coordination_workflow(session)
-
-                        end_time = datetime.now()
-                        response_time = (end_time - start_time).total_seconds() * 1000  # Convert to milliseconds
-
-                        # Verify performance target
-                        assert response_time < 500, f"Response time {response_time:.2f}ms exceeds 500ms target"
-                        assert result["success"] is True
-
-    @pytest.mark.asyncio
-    async def test_concurrent_coordination(self):
-        """Test handling multiple concurrent coordination sessions"""
-        coordination_agent = CoordinationAgent()
-
-        # Create multiple concurrent sessions
-        sessions = []
-        for i in range(10):  # Test 10 concurrent sessions
-            event = Event(
-                event_id=f"concurrent_event_{i}",
-                title=f"Concurrent Test Event {i}",
-                event_type=EventType.DINING,
-                organizer_id=f"organizer_{i}",
-                participants=[],
-                status=EventStatus.PLANNING,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
+        with patch.multiple(
+            coordination_agent,
+            _execute_participant_phase=AsyncMock(return_value=_OK_PARTICIPANT_PHASE),
+            _execute_scheduling_phase=AsyncMock(return_value=_OK_SCHEDULING_PHASE),
+            _execute_venue_phase=AsyncMock(return_value=_OK_VENUE_PHASE),
+            _execute_calendar_phase=AsyncMock(return_value=_OK_CALENDAR_PHASE)
+        ):
+            # Measure coordination time
+            start = time.perf_counter_ns()
 
             session = CoordinationSession(
-                session_id=f"concurrent_session_{i}",
+                session_id="perf_test_session",
                 event_id=event.event_id,
                 event=event,
                 current_phase=CoordinationPhase.PARTICIPANT_CONFIRMATION,
@@ -336,66 +343,81 @@ class TestPerformanceAndResilience:
                 created_at=datetime.now(),
                 updated_at=datetime.now()
             )
-            sessions.append(session)
 
-        # Mock agent responses for all sessions
-        with patch.object(coordination_agent, '_execute_participant_phase', new_callable=AsyncMock) as mock_participant:
-            mock_participant.return_value = {"success": True, "confirmed_participants": 5}
+            result = await coordination_agent._execute_full_coordination_workflow(session)
 
-            # Execute all sessions concurrently
-            start_time = datetime.now()
+            response_time = (time.perf_counter_ns() - start) / 1_000_000  # Convert to milliseconds
 
-            tasks = [
-                coordination_agent._execute_coordination_phase(session, CoordinationPhase.PARTICIPANT_CONFIRMATION)
-                for session in sessions
-            ]
+            # Verify performance target
+            assert response_time < 500, f"Response time {response_time:.2f}ms exceeds 500ms target"
+            assert result["success"] is True
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+    @pytest.mark.asyncio
+    async def test_concurrent_coordination(self, coordination_agent, event_template, session_template):
+        """Test handling multiple concurrent coordination sessions"""
 
-            end_time = datetime.now()
-            total_time = (end_time - start_time).total_seconds()
+        async def make_and_run(i):
+            # Deep copies so sessions share no mutable state with each other or the templates
+            event = event_template.model_copy(deep=True, update={
+                "event_id": f"concurrent_event_{i}",
+                "title": f"Concurrent Test Event {i}",
+                "organizer_id": f"organizer_{i}"
+            })
+
+            session = session_template.model_copy(deep=True, update={
+                "session_id": f"concurrent_session_{i}",
+                "event_id": event.event_id,
+                "event": event
+            })
+
+            return await coordination_agent._execute_coordination_phase(
+                session, CoordinationPhase.PARTICIPANT_CONFIRMATION
+            )
+
+        # Mock agent responses for all sessions
+        with patch.object(coordination_agent, '_execute_participant_phase', new_callable=AsyncMock) as mock_participant:
+            mock_participant.return_value = _OK_PARTICIPANT_PHASE
 
-            # Verify all sessions completed successfully
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    pytest.fail(f"Session {i} failed with exception: {result}")
-                assert result["success"] is True
+            # Build and execute 10 sessions concurrently
+            start = time.perf_counter_ns()
+
+            tasks = [asyncio.create_task(make_and_run(i)) for i in range(10)]
+            try:
+                # Verify each session as it completes, stopping at the first failure
+                for next_result in asyncio.as_completed(tasks):
+                    result = await next_result
+                    assert result["success"] is True
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            total_time = (time.perf_counter_ns() - start) / 1_000_000_000
 
             # Verify concurrent processing was efficient
             assert total_time < 2.0, f"Concurrent processing took {total_time:.2f}s, expected < 2.0s"
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_memory_efficiency(self, performance_test_data):
+    async def test_memory_efficiency(self, coordination_agent, performance_test_data, event_template, session_template):
         """Test memory usage with large datasets"""
         import tracemalloc
 
         # Start memory tracking
         tracemalloc.start()
 
-        coordination_agent = CoordinationAgent()
-
         # Process large participant list
-        event = Event(
-            event_id="memory_test_event",
-            title="Memory Test Event",
-            event_type=EventType.DINING,
-            organizer_id="organizer_memory",
-            participants=performance_test_data,  # All 50 participants
-            status=EventStatus.PLANNING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-
-        session = CoordinationSession(
-            session_id="memory_test_session",
-            event_id=event.event_id,
-            event=event,
-            current_phase=CoordinationPhase.PARTICIPANT_CONFIRMATION,
-            status=CoordinationStatus.IN_PROGRESS,
-            agent_states={},
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
+        event = event_template.model_copy(deep=True, update={
+            "event_id": "memory_test_event",
+            "title": "Memory Test Event",
+            "organizer_id": "organizer_memory",
+            "participants": list(performance_test_data)  # All 50 participants; update= skips validation
+        })
+
+        session = session_template.model_copy(deep=True, update={
+            "session_id": "memory_test_session",
+            "event_id": event.event_id,
+            "event": event
+        })
 
         # Mock processing
         with patch.object(coordination_agent, '_execute_participant_phase', new_callable=AsyncMock) as mock_participant:
@@ -412,9 +434,8 @@ class TestPerformanceAndResilience:
         assert peak_mb < 100, f"Memory usage {peak_mb:.2f}MB exceeds 100MB limit"
 
     @pytest.mark.asyncio
-    async def test_error_recovery(self):
+    async def test_error_recovery(self, coordination_agent):
         """Test system recovery from various error conditions"""
-        coordination_agent = CoordinationAgent()
 
         # Test network timeout recovery
         with patch.object(coordination_agent, '_execute_venue_phase', new_callable=AsyncMock) as mock_venue:
@@ -462,10 +483,10 @@ class TestIntegrationBoundaries:
         agent2 = ParticipantAgent("participant_2")
 
         # Modify state in agent1
-        agent1._internal_state = {"test": "data"}
+        agent1.context["test"] = "data"
 
         # Verify agent2 is not affected
-        assert not hasattr(agent2, '_internal_state') or agent2._internal_state != agent1._internal_state
+        assert agent2.context == {}
 
     @pytest.mark.asyncio
     async def test_message_validation(self):
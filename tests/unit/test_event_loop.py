@@ -0,0 +1,16 @@
+"""
+Unit tests for the unit-test event loop
+Tests that the conftest event_loop fixture selects uvloop
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_runs_on_uvloop():
+    """Test that async unit tests run on uvloop when available"""
+    uvloop = pytest.importorskip("uvloop")
+
+    assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
@@ -0,0 +1,76 @@
+"""
+Unit tests for Google Calendar event creation retries
+Tests the jittered exponential backoff in CalendarEventManager
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import call
+from unittest.mock import patch
+
+import pytest
+
+from src.integrations.google_calendar import CalendarEventManager
+from src.integrations.google_calendar import CalendarEventResponse
+from src.integrations.google_calendar import GoogleCalendarEvent
+
+
+@pytest.fixture
+def calendar_event():
+    """Create calendar event to retry"""
+    return GoogleCalendarEvent(
+        summary="チームランチ",
+        start_time=datetime(2024, 1, 1, 12, 0),
+        end_time=datetime(2024, 1, 1, 13, 0),
+        organizer="organizer@example.com"
+    )
+
+
+@pytest.fixture
+def backoff_patches():
+    """Patch the backoff sleep and make jitter return its upper bound"""
+    with patch(
+        "src.integrations.google_calendar.random.uniform",
+        side_effect=lambda low, high: high
+    ) as mock_uniform, patch(
+        "src.integrations.google_calendar.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        yield mock_uniform, mock_sleep
+
+
+class TestCreateEventWithRetry:
+    """Test retry backoff and retry cap of create_event_with_retry"""
+
+    @pytest.mark.asyncio
+    async def test_backoff_sequence_until_retry_cap(self, calendar_event, backoff_patches):
+        """Test jittered backoff between attempts and giving up after max_retries"""
+        mock_uniform, mock_sleep = backoff_patches
+        client = Mock(create_calendar_event=AsyncMock(side_effect=Exception("API error")))
+
+        result = await CalendarEventManager(client).create_event_with_retry(
+            "organizer@example.com", calendar_event, max_retries=3
+        )
+
+        # Three attempts, no sleep after the last one
+        assert client.create_calendar_event.await_count == 3
+        assert mock_uniform.call_args_list == [call(0, 0.5), call(0, 1.0)]
+        assert mock_sleep.await_args_list == [call(1.5), call(3.0)]
+
+        assert result.success is False
+        assert "リトライ回数超過" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_stops_retrying_after_success(self, calendar_event, backoff_patches):
+        """Test that a successful retry ends the backoff sequence"""
+        mock_uniform, mock_sleep = backoff_patches
+        created = CalendarEventResponse(success=True, event_id="event_1")
+        client = Mock(create_calendar_event=AsyncMock(side_effect=[Exception("API error"), created]))
+
+        result = await CalendarEventManager(client).create_event_with_retry(
+            "organizer@example.com", calendar_event, max_retries=3
+        )
+
+        assert result is created
+        assert client.create_calendar_event.await_count == 2
+        assert mock_sleep.await_args_list == [call(1.5)]